@@ -1,199 +1,257 @@
+from contextlib import asynccontextmanager
 from mcp.server.fastmcp import FastMCP
-import requests
+import aiohttp
+import time
 
 
 binja_server_url = "http://localhost:9009"
-mcp = FastMCP("binja-mcp", log_level="ERROR")
-
-
-# def safe_get(endpoint: str, params: dict = None) -> list:
-#     """
-#     Perform a GET request. If 'params' is given, we convert it to a query string.
-#     """
-#     if params is None:
-#         params = {}
-#     qs = [f"{k}={v}" for k, v in params.items()]
-#     query_string = "&".join(qs)
-#     url = f"{binja_server_url}/{endpoint}"
-#     if query_string:
-#         url += "?" + query_string
-
-#     try:
-#         response = requests.get(url, timeout=5)
-#         response.encoding = "utf-8"
-#         if response.ok:
-#             return response.text.splitlines()
-#         else:
-#             return [f"Error {response.status_code}: {response.text.strip()}"]
-#     except Exception as e:
-#         return [f"Request failed: {str(e)}"]
-
-
-def safe_post(endpoint: str, data: dict | str) -> str:
+_session: aiohttp.ClientSession | None = None
+
+# Seconds a read-only response may be reused. Calls to any other endpoint
+# (renames, comments) may change the binary and clear the whole cache.
+_CACHE_TTL = {
+    "status": 2.0,
+    "segments": 30.0,
+    "imports": 30.0,
+    "exports": 30.0,
+    "methods": 5.0,
+    "classes": 5.0,
+    "namespaces": 5.0,
+    "data": 5.0,
+    "searchFunctions": 5.0,
+    "decompile": 5.0,
+}
+_CACHE_MAX_ENTRIES = 256
+_cache: dict[tuple, tuple[float, str]] = {}
+# Bumped by every mutation so reads that overlapped one don't cache their result
+_cache_generation = 0
+# Request fields that only writes carry; comment reads share the write endpoints
+_WRITE_FIELDS = ("comment", "newName")
+
+
+def _is_write(data: dict | str | None) -> bool:
+    """Return True if a request changes the binary rather than reading it."""
+    if not isinstance(data, dict):
+        return False
+    return data.get("_method") == "DELETE" or any(f in data for f in _WRITE_FIELDS)
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """Return the shared HTTP session, creating it on first use."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            # Parse the server URL once; requests only carry the endpoint path
+            base_url=binja_server_url,
+            connector=aiohttp.TCPConnector(
+                limit=32, limit_per_host=32, ttl_dns_cache=None
+            ),
+            # Fail fast on connect so a dead plugin doesn't eat the whole budget
+            timeout=aiohttp.ClientTimeout(total=5, sock_connect=1),
+        )
+    return _session
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    await _get_session()
     try:
-        if isinstance(data, dict):
-            response = requests.post(
-                f"{binja_server_url}/{endpoint}", data=data, timeout=5
-            )
-        else:
-            response = requests.post(
-                f"{binja_server_url}/{endpoint}", data=data.encode("utf-8"), timeout=5
-            )
-        response.encoding = "utf-8"
-        if response.ok:
-            return response.text.strip()
+        yield
+    finally:
+        if _session is not None:
+            await _session.close()
+
+
+mcp = FastMCP("binja-mcp", log_level="ERROR", lifespan=lifespan)
+
+
+async def safe_post(endpoint: str, data: dict | str | None = None) -> str:
+    global _cache_generation
+    ttl = _CACHE_TTL.get(endpoint)
+    is_write = ttl is None and _is_write(data)
+    generation = _cache_generation
+    if ttl is not None:
+        key = (
+            endpoint,
+            tuple(sorted(data.items())) if isinstance(data, dict) else data,
+        )
+        cached = _cache.get(key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+    try:
+        session = await _get_session()
+        if isinstance(data, str):
+            body, headers = data.encode("utf-8"), {"Content-Type": "text/plain"}
         else:
-            return f"Error {response.status_code}: {response.text.strip()}"
+            body, headers = data, None
+        async with session.post(
+            f"/{endpoint}", data=body, headers=headers
+        ) as response:
+            text = await response.text(encoding="utf-8")
+            if response.ok:
+                result = text.strip()
+                if ttl is not None and generation == _cache_generation:
+                    if len(_cache) >= _CACHE_MAX_ENTRIES:
+                        _cache.clear()
+                    _cache[key] = (time.monotonic(), result)
+                return result
+            else:
+                return f"Error {response.status}: {text.strip()}"
     except Exception as e:
         return f"Request failed: {str(e)}"
+    finally:
+        if is_write:
+            _cache_generation += 1
+            _cache.clear()
 
 
 @mcp.tool()
-def list_methods(offset: int = 0, limit: int = 100) -> list:
+async def list_methods(offset: int = 0, limit: int = 100) -> list:
     """
     List all function names in the program with pagination.
     """
-    return safe_post("methods", {"offset": offset, "limit": limit})
+    return await safe_post("methods", {"offset": offset, "limit": limit})
 
 
 @mcp.tool()
-def list_classes(offset: int = 0, limit: int = 100) -> list:
+async def list_classes(offset: int = 0, limit: int = 100) -> list:
     """
     List all namespace/class names in the program with pagination.
     """
-    return safe_post("classes", {"offset": offset, "limit": limit})
+    return await safe_post("classes", {"offset": offset, "limit": limit})
 
 
 @mcp.tool()
-def decompile_function(name: str) -> str:
+async def decompile_function(name: str) -> str:
     """
     Decompile a specific function by name and return the decompiled C code.
     """
-    return safe_post("decompile", name)
+    return await safe_post("decompile", name)
 
 
 @mcp.tool()
-def rename_function(old_name: str, new_name: str) -> str:
+async def rename_function(old_name: str, new_name: str) -> str:
     """
     Rename a function by its current name to a new user-defined name.
     """
-    return safe_post("renameFunction", {"oldName": old_name, "newName": new_name})
+    return await safe_post("renameFunction", {"oldName": old_name, "newName": new_name})
 
 
 @mcp.tool()
-def rename_data(address: str, new_name: str) -> str:
+async def rename_data(address: str, new_name: str) -> str:
     """
     Rename a data label at the specified address.
     """
-    return safe_post("renameData", {"address": address, "newName": new_name})
+    return await safe_post("renameData", {"address": address, "newName": new_name})
 
 
 @mcp.tool()
-def set_comment(address: str, comment: str) -> str:
+async def set_comment(address: str, comment: str) -> str:
     """
     Set a comment at a specific address.
     """
-    return safe_post("comment", {"address": address, "comment": comment})
+    return await safe_post("comment", {"address": address, "comment": comment})
 
 
 @mcp.tool()
-def set_function_comment(function_name: str, comment: str) -> str:
+async def set_function_comment(function_name: str, comment: str) -> str:
     """
     Set a comment for a function.
     """
-    return safe_post("comment/function", {"name": function_name, "comment": comment})
+    return await safe_post("comment/function", {"name": function_name, "comment": comment})
 
 
 @mcp.tool()
-def get_comment(address: str) -> str:
+async def get_comment(address: str) -> str:
     """
     Get the comment at a specific address.
     """
-    return safe_post("comment", {"address": address})[0]
+    return await safe_post("comment", {"address": address})
 
 
 @mcp.tool()
-def get_function_comment(function_name: str) -> str:
+async def get_function_comment(function_name: str) -> str:
     """
     Get the comment for a function.
     """
-    return safe_post("comment/function", {"name": function_name})[0]
+    return await safe_post("comment/function", {"name": function_name})
 
 
 @mcp.tool()
-def list_segments(offset: int = 0, limit: int = 100) -> list:
+async def list_segments(offset: int = 0, limit: int = 100) -> list:
     """
     List all memory segments in the program with pagination.
     """
-    return safe_post("segments", {"offset": offset, "limit": limit})
+    return await safe_post("segments", {"offset": offset, "limit": limit})
 
 
 @mcp.tool()
-def list_imports(offset: int = 0, limit: int = 100) -> list:
+async def list_imports(offset: int = 0, limit: int = 100) -> list:
     """
     List imported symbols in the program with pagination.
     """
-    return safe_post("imports", {"offset": offset, "limit": limit})
+    return await safe_post("imports", {"offset": offset, "limit": limit})
 
 
 @mcp.tool()
-def list_exports(offset: int = 0, limit: int = 100) -> list:
+async def list_exports(offset: int = 0, limit: int = 100) -> list:
     """
     List exported functions/symbols with pagination.
     """
-    return safe_post("exports", {"offset": offset, "limit": limit})
+    return await safe_post("exports", {"offset": offset, "limit": limit})
 
 
 @mcp.tool()
-def list_namespaces(offset: int = 0, limit: int = 100) -> list:
+async def list_namespaces(offset: int = 0, limit: int = 100) -> list:
     """
     List all non-global namespaces in the program with pagination.
     """
-    return safe_post("namespaces", {"offset": offset, "limit": limit})
+    return await safe_post("namespaces", {"offset": offset, "limit": limit})
 
 
 @mcp.tool()
-def list_data_items(offset: int = 0, limit: int = 100) -> list:
+async def list_data_items(offset: int = 0, limit: int = 100) -> list:
     """
     List defined data labels and their values with pagination.
     """
-    return safe_post("data", {"offset": offset, "limit": limit})
+    return await safe_post("data", {"offset": offset, "limit": limit})
 
 
 @mcp.tool()
-def search_functions_by_name(query: str, offset: int = 0, limit: int = 100) -> list:
+async def search_functions_by_name(query: str, offset: int = 0, limit: int = 100) -> list:
     """
     Search for functions whose name contains the given substring.
     """
     if not query:
         return ["Error: query string is required"]
-    return safe_post(
+    return await safe_post(
         "searchFunctions", {"query": query, "offset": offset, "limit": limit}
     )
 
 
 @mcp.tool()
-def get_binary_status() -> str:
+async def get_binary_status() -> str:
     """
     Get the current status of the loaded binary.
     """
-    return safe_post("status")[0]
+    return await safe_post("status")
 
 
 @mcp.tool()
-def delete_comment(address: str) -> str:
+async def delete_comment(address: str) -> str:
     """
     Delete the comment at a specific address.
     """
-    return safe_post("comment", {"address": address, "_method": "DELETE"})
+    return await safe_post("comment", {"address": address, "_method": "DELETE"})
 
 
 @mcp.tool()
-def delete_function_comment(function_name: str) -> str:
+async def delete_function_comment(function_name: str) -> str:
     """
     Delete the comment for a function.
     """
-    return safe_post("comment/function", {"name": function_name, "_method": "DELETE"})
+    return await safe_post("comment/function", {"name": function_name, "_method": "DELETE"})
 
 
 if __name__ == "__main__":
@@ -1,11 +1,54 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, Tuple, Iterator
+import heapq
 import binaryninja as bn
 from ..core.binary_operations import BinaryOperations
 
+_EXCLUDED_EXPORT_TYPES = frozenset(
+    {bn.SymbolType.ImportedFunctionSymbol, bn.SymbolType.ExternalSymbol}
+)
+
+
+# Symbols always carry raw_name and full_name in the supported API versions, but
+# Function.raw_name does not exist in all of them
+_FUNCTION_HAS_RAW_NAME = hasattr(bn.Function, "raw_name")
+
+
+def _function_to_dict(func: bn.Function) -> Dict[str, Any]:
+    symbol = func.symbol
+    return {
+        "name": func.name,
+        "address": f"0x{func.start:x}",
+        "raw_name": func.raw_name if _FUNCTION_HAS_RAW_NAME else func.name,
+        "symbol": {
+            "type": str(symbol.type),
+            "full_name": symbol.full_name,
+        }
+        if symbol
+        else None,
+    }
+
 
 class BinaryNinjaEndpoints:
     def __init__(self, binary_ops: BinaryOperations):
         self.binary_ops = binary_ops
+        self._cache: Dict[str, Tuple[int, List[Any]]] = {}
+
+    def _cached(
+        self, name: str, build: Callable[[bn.BinaryView], List[Any]]
+    ) -> List[Any]:
+        """Return a list built for the current view, rebuilt once the view changes"""
+        view, version = self.binary_ops.view_snapshot()
+        if view is None:
+            raise RuntimeError("No binary loaded")
+        entry = self._cache.get(name)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        items = build(view)
+        # Don't keep a list that may predate a change made while it was built
+        if self.binary_ops.view_version == version:
+            self._cache[name] = (version, items)
+        return items
 
     def get_status(self) -> Dict[str, Any]:
         """Get the current status of the binary view"""
@@ -24,105 +67,73 @@ class BinaryNinjaEndpoints:
             bn.log_error(f"Error getting function info: {e}")
             return None
 
-    def get_imports(self, offset: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get list of imported functions"""
+    def get_imports(
+        self, offset: int = 0, limit: int = 100
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over a page of imported functions"""
         if not self.binary_ops.current_view:
             raise RuntimeError("No binary loaded")
 
-        imports = []
-        for sym in self.binary_ops.current_view.get_symbols_of_type(
-            bn.SymbolType.ImportedFunctionSymbol
-        ):
-            imports.append(
-                {
-                    "name": sym.name,
-                    "address": hex(sym.address),
-                    "raw_name": sym.raw_name if hasattr(sym, "raw_name") else sym.name,
-                    "full_name": sym.full_name
-                    if hasattr(sym, "full_name")
-                    else sym.name,
-                }
-            )
-        return imports[offset : offset + limit]
-
-    def get_exports(self, offset: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get list of exported symbols"""
+        symbols = self._cached(
+            "imports",
+            lambda view: list(
+                view.get_symbols_of_type(bn.SymbolType.ImportedFunctionSymbol)
+            ),
+        )
+        return (
+            {
+                "name": sym.name,
+                "address": f"0x{sym.address:x}",
+                "raw_name": sym.raw_name,
+                "full_name": sym.full_name,
+            }
+            for sym in symbols[offset : offset + limit]
+        )
+
+    def get_exports(
+        self, offset: int = 0, limit: int = 100
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over a page of exported symbols"""
         if not self.binary_ops.current_view:
             raise RuntimeError("No binary loaded")
 
-        exports = []
-        for sym in self.binary_ops.current_view.get_symbols():
-            if sym.type not in [
-                bn.SymbolType.ImportedFunctionSymbol,
-                bn.SymbolType.ExternalSymbol,
-            ]:
-                exports.append(
-                    {
-                        "name": sym.name,
-                        "address": hex(sym.address),
-                        "raw_name": sym.raw_name
-                        if hasattr(sym, "raw_name")
-                        else sym.name,
-                        "full_name": sym.full_name
-                        if hasattr(sym, "full_name")
-                        else sym.name,
-                        "type": str(sym.type),
-                    }
-                )
-        return exports[offset : offset + limit]
+        symbols = self._cached(
+            "exports",
+            lambda view: [
+                sym
+                for sym in view.get_symbols()
+                if sym.type not in _EXCLUDED_EXPORT_TYPES
+            ],
+        )
+        return (
+            {
+                "name": sym.name,
+                "address": f"0x{sym.address:x}",
+                "raw_name": sym.raw_name,
+                "full_name": sym.full_name,
+                "type": str(sym.type),
+            }
+            for sym in symbols[offset : offset + limit]
+        )
 
     def get_namespaces(self, offset: int = 0, limit: int = 100) -> List[str]:
         """Get list of C++ namespaces"""
         if not self.binary_ops.current_view:
             raise RuntimeError("No binary loaded")
 
+        sorted_namespaces = self._cached("namespaces", self._collect_namespaces)
+        return sorted_namespaces[offset : offset + limit]
+
+    def _collect_namespaces(self, view: bn.BinaryView) -> List[str]:
         namespaces = set()
-        for sym in self.binary_ops.current_view.get_symbols():
+        for sym in view.get_symbols():
             if "::" in sym.name:
                 parts = sym.name.split("::")
                 if len(parts) > 1:
                     namespace = "::".join(parts[:-1])
                     namespaces.add(namespace)
 
-        sorted_namespaces = sorted(list(namespaces))
-        return sorted_namespaces[offset : offset + limit]
-
-    def get_defined_data(
-        self, offset: int = 0, limit: int = 100
-    ) -> List[Dict[str, Any]]:
-        """Get list of defined data variables"""
-        if not self.binary_ops.current_view:
-            raise RuntimeError("No binary loaded")
-
-        data_items = []
-        for var in self.binary_ops.current_view.data_vars:
-            data_type = self.binary_ops.current_view.get_type_at(var)
-            value = None
-
-            try:
-                if data_type and data_type.width <= 8:
-                    value = str(
-                        self.binary_ops.current_view.read_int(var, data_type.width)
-                    )
-                else:
-                    value = "(complex data)"
-            except (ValueError, TypeError):
-                value = "(unreadable)"
-
-            sym = self.binary_ops.current_view.get_symbol_at(var)
-            data_items.append(
-                {
-                    "address": hex(var),
-                    "name": sym.name if sym else "(unnamed)",
-                    "raw_name": sym.raw_name
-                    if sym and hasattr(sym, "raw_name")
-                    else None,
-                    "value": value,
-                    "type": str(data_type) if data_type else None,
-                }
-            )
-
-        return data_items[offset : offset + limit]
+        return sorted(namespaces)
 
     def search_functions(
         self, search_term: str, offset: int = 0, limit: int = 100
@@ -134,27 +145,16 @@ class BinaryNinjaEndpoints:
         if not search_term:
             return []
 
-        matches = []
-        for func in self.binary_ops.current_view.functions:
-            if search_term.lower() in func.name.lower():
-                matches.append(
-                    {
-                        "name": func.name,
-                        "address": hex(func.start),
-                        "raw_name": func.raw_name
-                        if hasattr(func, "raw_name")
-                        else func.name,
-                        "symbol": {
-                            "type": str(func.symbol.type) if func.symbol else None,
-                            "full_name": func.symbol.full_name if func.symbol else None,
-                        }
-                        if func.symbol
-                        else None,
-                    }
-                )
-
-        matches.sort(key=lambda x: x["name"])
-        return matches[offset : offset + limit]
+        # Keep the first offset + limit matches by name; only the page becomes dicts
+        term = search_term.lower()
+        matches = (
+            (func.name, func)
+            for func in self.binary_ops.current_view.functions
+            if term in func.name.lower()
+        )
+        top = heapq.nsmallest(offset + limit, matches, key=lambda match: match[0])
+
+        return [_function_to_dict(func) for _, func in top[offset : offset + limit]]
 
     def decompile_function(self, identifier: str) -> Optional[str]:
         """Decompile a function by name or address"""
@@ -1,12 +1,205 @@
+import functools
+import heapq
+import itertools
+import threading
+import time
+from collections import OrderedDict
 import binaryninja as bn
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Tuple, Callable
 from .config import BinaryNinjaConfig
+from ..utils.string_utils import parse_address
+
+# Maximum number of decompiled functions kept in memory
+DECOMPILE_CACHE_SIZE = 256
+
+# Maximum number of identifier to function resolutions kept in memory
+RESOLVE_CACHE_SIZE = 64
+
+# Number of functions suggested in "function not found" errors, and how long
+# (in seconds) that suggestion list is reused
+FUNCTION_HINTS_COUNT = 10
+FUNCTION_HINTS_TTL = 5.0
+
+
+def _resolve_loader() -> Tuple[str, Callable[[str], bn.BinaryView]]:
+    """Pick the binary loading method supported by the installed Binary Ninja API"""
+    if hasattr(bn, "open_view"):
+        return "bn.open_view", bn.open_view
+
+    if hasattr(bn, "BinaryViewType") and hasattr(
+        bn.BinaryViewType, "get_view_of_file"
+    ):
+        get_view_of_file = bn.BinaryViewType.get_view_of_file
+        get_default_options = getattr(bn.BinaryViewType, "get_default_options", None)
+
+        def load_view_of_file(filepath: str) -> bn.BinaryView:
+            file_metadata = bn.FileMetadata()
+            try:
+                if get_default_options:
+                    return get_view_of_file(
+                        filepath, file_metadata, get_default_options()
+                    )
+                return get_view_of_file(filepath, file_metadata)
+            except TypeError:
+                return get_view_of_file(filepath)
+
+        return "BinaryViewType.get_view_of_file", load_view_of_file
+
+    def load_legacy(filepath: str) -> bn.BinaryView:
+        file_metadata = bn.FileMetadata()
+        binary_view_type = bn.BinaryViewType.get_view_of_file_with_options(
+            filepath, file_metadata
+        )
+        if not binary_view_type:
+            raise Exception("No view type available for this file")
+        return binary_view_type.open()
+
+    return "legacy", load_legacy
+
+
+_LOADER_NAME, _LOAD_IMPL = _resolve_loader()
+
+_SEGMENT_READABLE = bn.SegmentFlag.SegmentReadable
+_SEGMENT_WRITABLE = bn.SegmentFlag.SegmentWritable
+_SEGMENT_EXECUTABLE = bn.SegmentFlag.SegmentExecutable
+
+# Attributes whose presence on a structure marks it as a class
+_CLASS_ATTRS = frozenset({"vtable", "base_structures", "members", "functions"})
+_class_like_structures: Dict[type, bool] = {}
+
+
+def _synchronized(method):
+    """Run a BinaryOperations method while holding the instance lock"""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _has_class_attrs(structure) -> bool:
+    """Check for class attributes without evaluating (possibly costly) properties"""
+    structure_class = type(structure)
+    has_attrs = _class_like_structures.get(structure_class)
+    if has_attrs is None:
+        has_attrs = any(hasattr(structure_class, attr) for attr in _CLASS_ATTRS)
+        _class_like_structures[structure_class] = has_attrs
+    return has_attrs or not _CLASS_ATTRS.isdisjoint(getattr(structure, "__dict__", ()))
+
+
+def _is_class_type(type_obj) -> bool:
+    try:
+        # Skip None or invalid types
+        if not type_obj or not hasattr(type_obj, "name"):
+            return False
+
+        # Method 1: Check type_class attribute
+        if hasattr(type_obj, "type_class"):
+            return True
+
+        # Method 2: Check structure attribute
+        structure = getattr(type_obj, "structure", None)
+        if structure:
+            # Check various attributes that indicate a class
+            if _has_class_attrs(structure):
+                return True
+
+            # Check type attribute if available
+            if hasattr(structure, "type"):
+                type_str = str(structure.type).lower()
+                return "class" in type_str or "struct" in type_str
+
+    except Exception as e:
+        bn.log_debug(
+            f"Error processing type {getattr(type_obj, 'name', '<unknown>')}: {e}"
+        )
+    return False
+
+
+class _ViewChangeNotification(bn.BinaryDataNotification):
+    """Flags the owner's caches as stale when analysis or the UI changes the view.
+
+    Callbacks run on Binary Ninja's threads, possibly while a request thread holds
+    the owner's lock inside an API call, so they only set a flag and never lock.
+    """
+
+    def __init__(self, owner: "BinaryOperations"):
+        # Subscribe only to the callbacks below so the core doesn't call into
+        # Python for every data variable, type or tag change during analysis
+        super().__init__(
+            bn.NotificationType.FunctionAdded
+            | bn.NotificationType.FunctionRemoved
+            | bn.NotificationType.FunctionUpdated
+            | bn.NotificationType.SymbolAdded
+            | bn.NotificationType.SymbolUpdated
+            | bn.NotificationType.SymbolRemoved
+        )
+        self._owner = owner
+
+    def _mark_stale(self, *args):
+        self._owner._view_changed = True
+
+    def function_updated(self, view, func):
+        # Retypes, variable renames and further analysis change the decompiled text
+        owner = self._owner
+        owner._updated_functions.add(func.start)
+        owner._bump_decompile_generation()
+
+    function_added = _mark_stale
+    function_removed = _mark_stale
+    symbol_added = _mark_stale
+    symbol_updated = _mark_stale
+    symbol_removed = _mark_stale
 
 
 class BinaryOperations:
+    __slots__ = (
+        "config",
+        "_lock",
+        "_current_view",
+        "_view_version",
+        "_view_changed",
+        "_updated_functions",
+        "_notification",
+        "_name_index",
+        "_lower_name_index",
+        "_decompile_cache",
+        "_decompile_generation",
+        "_generation_counter",
+        "_resolve_cache",
+        "_function_hints",
+        "_rename_strategy",
+    )
+
+    # Function rename methods, in the order they are tried by default
+    _RENAME_STRATEGIES = ("_rename_direct", "_rename_via_symbol", "_rename_via_update")
+
     def __init__(self, config: BinaryNinjaConfig):
         self.config = config
+        # Binary Ninja's API is not fully reentrant, so state changes and cache
+        # bookkeeping are serialized across request threads
+        self._lock = threading.RLock()
         self._current_view: Optional[bn.BinaryView] = None
+        self._view_version = 0
+        self._view_changed = False
+        self._updated_functions: set = set()
+        self._notification = _ViewChangeNotification(self)
+        self._name_index: Optional[Dict[str, bn.Function]] = None
+        self._lower_name_index: Optional[Dict[str, bn.Function]] = None
+        self._decompile_cache: "OrderedDict[Tuple[int, int], str]" = OrderedDict()
+        # Changes whenever cached decompilation may be outdated; a render that
+        # overlapped a change is not stored. Values come from a shared counter
+        # so they never repeat, even when bumped without the lock.
+        self._generation_counter = itertools.count(1)
+        self._decompile_generation = 0
+        # identifier -> (function, how it matched: "address", "name" or "symbol")
+        self._resolve_cache: (
+            "OrderedDict[Union[str, int], Tuple[bn.Function, str]]"
+        ) = OrderedDict()
+        self._function_hints: Optional[Tuple[float, List[Dict[str, str]]]] = None
+        self._rename_strategy: Optional[str] = None
 
     @property
     def current_view(self) -> Optional[bn.BinaryView]:
@@ -14,46 +207,104 @@ class BinaryOperations:
 
     @current_view.setter
     def current_view(self, bv: Optional[bn.BinaryView]):
-        self._current_view = bv
+        with self._lock:
+            self._attach_view(bv)
         if bv:
             bn.log_info(f"Set current binary view: {bv.file.filename}")
         else:
             bn.log_info("Cleared current binary view")
 
+    @property
+    def view_version(self) -> int:
+        """Counter bumped whenever the view, its functions or its symbols change"""
+        with self._lock:
+            self._apply_view_changes()
+            return self._view_version
+
+    def view_snapshot(self) -> Tuple[Optional[bn.BinaryView], int]:
+        """Return the current view together with its view_version, read atomically"""
+        with self._lock:
+            self._apply_view_changes()
+            return self._current_view, self._view_version
+
+    def _attach_view(self, bv: Optional[bn.BinaryView]):
+        """Make bv the current view and follow its changes (caller holds the lock)"""
+        old_view = self._current_view
+        if old_view is not None:
+            try:
+                old_view.unregister_notification(self._notification)
+            except Exception as e:
+                bn.log_debug(f"Failed to unregister view notification: {e}")
+        self._current_view = bv
+        if bv is not None:
+            bv.register_notification(self._notification)
+        self._rename_strategy = None
+        self._view_changed = False
+        self._updated_functions.clear()
+        self._invalidate_caches()
+
+    def _apply_view_changes(self):
+        """Drop caches if the view changed outside this class (caller holds the lock)"""
+        if self._view_changed:
+            self._view_changed = False
+            self._invalidate_caches()
+
+        # set.add and set.pop are atomic, so notification threads can keep adding
+        updated = self._updated_functions
+        if updated:
+            view_id = id(self._current_view)
+            while updated:
+                self._decompile_cache.pop((view_id, updated.pop()), None)
+
+    def _invalidate_caches(self):
+        self._view_version += 1
+        self._name_index = None
+        self._lower_name_index = None
+        self._invalidate_decompile_cache()
+        self._resolve_cache.clear()
+        self._function_hints = None
+
+    def _bump_decompile_generation(self):
+        self._decompile_generation = next(self._generation_counter)
+
+    def _invalidate_decompile_cache(self):
+        self._bump_decompile_generation()
+        self._decompile_cache.clear()
+
+    def _ensure_function_index(self):
+        """Build the name -> function lookup tables in a single pass if needed"""
+        if self._name_index is not None:
+            return
+
+        name_index = {}
+        lower_name_index = {}
+        for func in self._current_view.functions:
+            name = func.name
+            # Keep the first function per key, matching the old linear scan
+            name_index.setdefault(name, func)
+            lower_name_index.setdefault(name.lower(), func)
+
+        self._name_index = name_index
+        self._lower_name_index = lower_name_index
+
+    @_synchronized
+    def _find_function_by_name(self, name: str) -> Optional[bn.Function]:
+        """Find a function by exact name, falling back to a case-insensitive match"""
+        # The view notification marks the index stale when functions are added,
+        # removed or renamed, so a miss is final and needs no rebuild
+        self._apply_view_changes()
+        self._ensure_function_index()
+        func = self._name_index.get(name)
+        if func is None:
+            func = self._lower_name_index.get(name.lower())
+        return func
+
+    @_synchronized
     def load_binary(self, filepath: str) -> bn.BinaryView:
         """Load a binary file using the appropriate method based on the Binary Ninja API version"""
         try:
-            if hasattr(bn, "open_view"):
-                bn.log_info("Using bn.open_view method")
-                self._current_view = bn.open_view(filepath)
-            elif hasattr(bn, "BinaryViewType") and hasattr(
-                bn.BinaryViewType, "get_view_of_file"
-            ):
-                bn.log_info("Using BinaryViewType.get_view_of_file method")
-                file_metadata = bn.FileMetadata()
-                try:
-                    if hasattr(bn.BinaryViewType, "get_default_options"):
-                        options = bn.BinaryViewType.get_default_options()
-                        self._current_view = bn.BinaryViewType.get_view_of_file(
-                            filepath, file_metadata, options
-                        )
-                    else:
-                        self._current_view = bn.BinaryViewType.get_view_of_file(
-                            filepath, file_metadata
-                        )
-                except TypeError:
-                    self._current_view = bn.BinaryViewType.get_view_of_file(filepath)
-            else:
-                bn.log_info("Using legacy method")
-                file_metadata = bn.FileMetadata()
-                binary_view_type = bn.BinaryViewType.get_view_of_file_with_options(
-                    filepath, file_metadata
-                )
-                if binary_view_type:
-                    self._current_view = binary_view_type.open()
-                else:
-                    raise Exception("No view type available for this file")
-
+            bn.log_info(f"Using {_LOADER_NAME} method")
+            self._attach_view(_LOAD_IMPL(filepath))
             return self._current_view
         except Exception as e:
             bn.log_error(f"Failed to load binary: {e}")
@@ -73,42 +324,77 @@ class BinaryOperations:
         if not self._current_view:
             raise RuntimeError("No binary loaded")
 
-        # Handle address-based lookup
-        try:
-            if isinstance(identifier, str) and identifier.startswith("0x"):
-                addr = int(identifier, 16)
-            elif isinstance(identifier, (int, str)):
-                addr = int(identifier) if isinstance(identifier, str) else identifier
+        with self._lock:
+            self._apply_view_changes()
+            entry = self._resolve_cache.get(identifier)
+            if entry is not None:
+                func, match = entry
+                # Names can change outside this class, so re-check name matches;
+                # address and raw symbol matches stay valid until invalidation
+                if match != "name" or func.name.lower() == identifier.lower():
+                    self._resolve_cache.move_to_end(identifier)
+                    return func
+
+        func, match = self._lookup_function(identifier)
+        if func is not None:
+            with self._lock:
+                self._resolve_cache[identifier] = (func, match)
+                if len(self._resolve_cache) > RESOLVE_CACHE_SIZE:
+                    self._resolve_cache.popitem(last=False)
+        return func
+
+    def _lookup_function(
+        self, identifier: Union[str, int]
+    ) -> Tuple[Optional[bn.Function], str]:
+        """Resolve an identifier to a function without consulting the resolve cache.
 
-            func = self._current_view.get_function_at(addr)
+        Returns the function (or None) and how it matched: "address", "name" or
+        "symbol".
+        """
+        # Handle address-based lookup
+        numeric_addr = parse_address(identifier)
+        if numeric_addr is not None:
+            func = self._current_view.get_function_at(numeric_addr)
             if func:
-                bn.log_info(f"Found function at address {hex(addr)}: {func.name}")
-                return func
-        except ValueError:
-            pass
+                if self.config.log_level == "DEBUG":
+                    bn.log_debug(
+                        f"Found function at address {numeric_addr:#x}: {func.name}"
+                    )
+                return func, "address"
 
-        # Handle name-based lookup with case sensitivity
-        for func in self._current_view.functions:
-            if func.name == identifier:
-                bn.log_info(f"Found function by name: {func.name}")
-                return func
+            # Not a function start; names can't match a number, so only try the
+            # function containing the address
+            funcs = self._current_view.get_functions_containing(numeric_addr)
+            if funcs:
+                if self.config.log_level == "DEBUG":
+                    bn.log_debug(
+                        f"Found function containing address {numeric_addr:#x}: {funcs[0].name}"
+                    )
+                return funcs[0], "address"
 
-        # Try case-insensitive match as fallback
-        for func in self._current_view.functions:
-            if func.name.lower() == str(identifier).lower():
-                bn.log_info(f"Found function by case-insensitive name: {func.name}")
-                return func
+            bn.log_error(f"Could not find function: {identifier}")
+            return None, "address"
+
+        ident_str = identifier if isinstance(identifier, str) else str(identifier)
+
+        # Handle name-based lookup, preferring exact over case-insensitive matches
+        func = self._find_function_by_name(ident_str)
+        if func:
+            if self.config.log_level == "DEBUG":
+                bn.log_debug(f"Found function by name: {func.name}")
+            return func, "name"
 
         # Try symbol table lookup as last resort
-        symbol = self._current_view.get_symbol_by_raw_name(str(identifier))
+        symbol = self._current_view.get_symbol_by_raw_name(ident_str)
         if symbol and symbol.address:
             func = self._current_view.get_function_at(symbol.address)
             if func:
-                bn.log_info(f"Found function through symbol lookup: {func.name}")
-                return func
+                if self.config.log_level == "DEBUG":
+                    bn.log_debug(f"Found function through symbol lookup: {func.name}")
+                return func, "symbol"
 
         bn.log_error(f"Could not find function: {identifier}")
-        return None
+        return None, "symbol"
 
     def get_function_names(
         self, offset: int = 0, limit: int = 100
@@ -117,73 +403,53 @@ class BinaryOperations:
         if not self._current_view:
             raise RuntimeError("No binary loaded")
 
+        has_raw_name = hasattr(bn.Function, "raw_name")
+
         functions = []
-        for func in self._current_view.functions:
+        for func in itertools.islice(
+            self._current_view.functions, offset, offset + limit
+        ):
             functions.append(
                 {
                     "name": func.name,
-                    "address": hex(func.start),
-                    "raw_name": func.raw_name
-                    if hasattr(func, "raw_name")
-                    else func.name,
+                    "address": f"{func.start:#x}",
+                    "raw_name": func.raw_name if has_raw_name else func.name,
                 }
             )
 
-        return functions[offset : offset + limit]
+        return functions
+
+    def get_function_hints(self) -> List[Dict[str, str]]:
+        """Get the first few function names, cached briefly, for error responses"""
+        with self._lock:
+            self._apply_view_changes()
+            hints = self._function_hints
+        now = time.monotonic()
+        if hints is None or now - hints[0] >= FUNCTION_HINTS_TTL:
+            hints = (now, self.get_function_names(0, FUNCTION_HINTS_COUNT))
+            self._function_hints = hints
+        return hints[1]
 
     def get_class_names(self, offset: int = 0, limit: int = 100) -> List[str]:
         """Get list of class names with pagination"""
         if not self._current_view:
             raise RuntimeError("No binary loaded")
 
-        class_names = set()
-
         try:
             # Try different methods to identify classes
-            for type_obj in self._current_view.types.values():
-                try:
-                    # Skip None or invalid types
-                    if not type_obj or not hasattr(type_obj, "name"):
-                        continue
-
-                    # Method 1: Check type_class attribute
-                    if hasattr(type_obj, "type_class"):
-                        class_names.add(type_obj.name)
-                        continue
-
-                    # Method 2: Check structure attribute
-                    if hasattr(type_obj, "structure") and type_obj.structure:
-                        structure = type_obj.structure
-
-                        # Check various attributes that indicate a class
-                        if any(
-                            hasattr(structure, attr)
-                            for attr in [
-                                "vtable",
-                                "base_structures",
-                                "members",
-                                "functions",
-                            ]
-                        ):
-                            class_names.add(type_obj.name)
-                            continue
-
-                        # Check type attribute if available
-                        if hasattr(structure, "type"):
-                            type_str = str(structure.type).lower()
-                            if "class" in type_str or "struct" in type_str:
-                                class_names.add(type_obj.name)
-                                continue
-
-                except Exception as e:
-                    bn.log_debug(
-                        f"Error processing type {getattr(type_obj, 'name', '<unknown>')}: {e}"
-                    )
-                    continue
+            class_names = {
+                type_obj.name
+                for type_obj in self._current_view.types.values()
+                if _is_class_type(type_obj)
+            }
 
-            bn.log_info(f"Found {len(class_names)} classes")
-            sorted_names = sorted(list(class_names))
-            return sorted_names[offset : offset + limit]
+            if self.config.log_level == "DEBUG":
+                bn.log_debug(f"Found {len(class_names)} classes")
+            # A bounded heap only pays off when the page is a small prefix
+            wanted = offset + limit
+            if wanted * 2 > len(class_names):
+                return sorted(class_names)[offset:wanted]
+            return heapq.nsmallest(wanted, class_names)[offset:]
 
         except Exception as e:
             bn.log_error(f"Error getting class names: {e}")
@@ -194,43 +460,67 @@ class BinaryOperations:
         if not self._current_view:
             raise RuntimeError("No binary loaded")
 
+        page = list(
+            itertools.islice(self._current_view.segments, offset, offset + limit)
+        )
+        if not page:
+            return []
+
+        # All segments share one class, so probe its capabilities once
+        segment_class = type(page[0])
+        has_name = hasattr(segment_class, "name")
+        has_data_name = hasattr(segment_class, "data_name")
+        has_flags = hasattr(segment_class, "flags")
+        has_readable = hasattr(segment_class, "readable")
+        has_writable = hasattr(segment_class, "writable")
+        has_executable = hasattr(segment_class, "executable")
+
         segments = []
-        for segment in self._current_view.segments:
+        for segment in page:
             segment_info = {
-                "start": hex(segment.start),
-                "end": hex(segment.end),
+                "start": f"{segment.start:#x}",
+                "end": f"{segment.end:#x}",
                 "name": "",
                 "flags": [],
             }
 
             # Try to get segment name if available
-            if hasattr(segment, "name"):
+            if has_name:
                 segment_info["name"] = segment.name
-            elif hasattr(segment, "data_name"):
+            elif has_data_name:
                 segment_info["name"] = segment.data_name
 
             # Try to get segment flags safely
-            if hasattr(segment, "flags"):
+            flags = None
+            if has_flags:
                 try:
-                    if isinstance(segment.flags, (list, tuple)):
-                        segment_info["flags"] = list(segment.flags)
+                    flags = segment.flags
+                    if isinstance(flags, (list, tuple)):
+                        segment_info["flags"] = list(flags)
                     else:
-                        segment_info["flags"] = [str(segment.flags)]
+                        segment_info["flags"] = [str(flags)]
                 except (AttributeError, TypeError, ValueError):
                     pass
 
-            # Add segment permissions if available
-            if hasattr(segment, "readable"):
-                segment_info["readable"] = bool(segment.readable)
-            if hasattr(segment, "writable"):
-                segment_info["writable"] = bool(segment.writable)
-            if hasattr(segment, "executable"):
-                segment_info["executable"] = bool(segment.executable)
+            # Add segment permissions, decoded from the SegmentFlag bitmask when
+            # possible instead of reading one property per permission
+            if isinstance(flags, int):
+                segment_info["readable"] = bool(flags & _SEGMENT_READABLE)
+                segment_info["writable"] = bool(flags & _SEGMENT_WRITABLE)
+                segment_info["executable"] = bool(flags & _SEGMENT_EXECUTABLE)
+            else:
+                if has_readable:
+                    segment_info["readable"] = bool(segment.readable)
+                if has_writable:
+                    segment_info["writable"] = bool(segment.writable)
+                if has_executable:
+                    segment_info["executable"] = bool(segment.executable)
 
             segments.append(segment_info)
 
-        return segments[offset : offset + limit]
+        return segments
 
+    @_synchronized
     def rename_function(self, old_name: str, new_name: str) -> bool:
         """Rename a function using multiple fallback methods.
 
@@ -244,74 +534,91 @@ class BinaryOperations:
         if not self._current_view:
             raise RuntimeError("No binary loaded")
 
+        if not new_name or not isinstance(new_name, str):
+            bn.log_error(f"Invalid new name: {new_name}")
+            return False
+
         try:
             func = self.get_function_by_name_or_address(old_name)
             if not func:
                 bn.log_error(f"Function not found: {old_name}")
                 return False
 
-            bn.log_info(f"Found function to rename: {func.name} at {hex(func.start)}")
-
-            if not new_name or not isinstance(new_name, str):
-                bn.log_error(f"Invalid new name: {new_name}")
-                return False
+            if self.config.log_level == "DEBUG":
+                bn.log_debug(
+                    f"Found function to rename: {func.name} at {func.start:#x}"
+                )
 
             if not hasattr(func, "name") or not hasattr(func, "__setattr__"):
                 bn.log_error(f"Function {func.name} cannot be renamed (read-only)")
                 return False
 
-            try:
-                # Try direct name assignment first
-                old_name = func.name
-                func.name = new_name
-
-                if func.name == new_name:
-                    bn.log_info(
-                        f"Successfully renamed function from {old_name} to {new_name}"
-                    )
+            # Try the method that last worked for this view first, then the
+            # remaining ones in their usual order
+            strategies = list(self._RENAME_STRATEGIES)
+            if self._rename_strategy in strategies:
+                strategies.remove(self._rename_strategy)
+                strategies.insert(0, self._rename_strategy)
+
+            for strategy in strategies:
+                if getattr(self, strategy)(func, new_name):
+                    self._rename_strategy = strategy
+                    self._invalidate_caches()
                     return True
 
-                # Try symbol-based renaming if direct assignment fails
-                if hasattr(func, "symbol") and func.symbol:
-                    try:
-                        new_symbol = bn.Symbol(
-                            func.symbol.type,
-                            func.start,
-                            new_name,
-                            namespace=func.symbol.namespace
-                            if hasattr(func.symbol, "namespace")
-                            else None,
-                        )
-                        self._current_view.define_user_symbol(new_symbol)
-                        bn.log_info("Successfully renamed function using symbol table")
-                        return True
-                    except Exception as e:
-                        bn.log_error(f"Symbol-based rename failed: {e}")
-
-                # Try function update method as last resort
-                if hasattr(self._current_view, "update_function"):
-                    try:
-                        func_copy = func
-                        func_copy.name = new_name
-                        self._current_view.update_function(func)
-                        bn.log_info("Successfully renamed function using update method")
-                        return True
-                    except Exception as e:
-                        bn.log_error(f"Function update rename failed: {e}")
-
-                bn.log_error(
-                    f"All rename methods failed - function name unchanged: {func.name}"
-                )
-                return False
-
-            except Exception as e:
-                bn.log_error(f"Error during rename operation: {e}")
-                return False
+            bn.log_error(
+                f"All rename methods failed - function name unchanged: {func.name}"
+            )
+            return False
 
         except Exception as e:
             bn.log_error(f"Error in rename_function: {e}")
             return False
 
+    def _rename_direct(self, func: bn.Function, new_name: str) -> bool:
+        try:
+            old_name = func.name
+            func.name = new_name
+            if func.name == new_name:
+                bn.log_info(
+                    f"Successfully renamed function from {old_name} to {new_name}"
+                )
+                return True
+        except Exception as e:
+            bn.log_error(f"Error during rename operation: {e}")
+        return False
+
+    def _rename_via_symbol(self, func: bn.Function, new_name: str) -> bool:
+        if not hasattr(func, "symbol") or not func.symbol:
+            return False
+        try:
+            new_symbol = bn.Symbol(
+                func.symbol.type,
+                func.start,
+                new_name,
+                namespace=func.symbol.namespace
+                if hasattr(func.symbol, "namespace")
+                else None,
+            )
+            self._current_view.define_user_symbol(new_symbol)
+            bn.log_info("Successfully renamed function using symbol table")
+            return True
+        except Exception as e:
+            bn.log_error(f"Symbol-based rename failed: {e}")
+        return False
+
+    def _rename_via_update(self, func: bn.Function, new_name: str) -> bool:
+        if not hasattr(self._current_view, "update_function"):
+            return False
+        try:
+            func.name = new_name
+            self._current_view.update_function(func)
+            bn.log_info("Successfully renamed function using update method")
+            return True
+        except Exception as e:
+            bn.log_error(f"Function update rename failed: {e}")
+        return False
+
     def get_function_info(
         self, identifier: Union[str, int]
     ) -> Optional[Dict[str, Any]]:
@@ -323,12 +630,13 @@ class BinaryOperations:
         if not func:
             return None
 
-        bn.log_info(f"Found function: {func.name} at {hex(func.start)}")
+        if self.config.log_level == "DEBUG":
+            bn.log_debug(f"Found function: {func.name} at {func.start:#x}")
 
         info = {
             "name": func.name,
             "raw_name": func.raw_name if hasattr(func, "raw_name") else func.name,
-            "address": hex(func.start),
+            "address": f"{func.start:#x}",
             "symbol": None,
         }
 
@@ -358,20 +666,40 @@ class BinaryOperations:
         if not func:
             return None
 
+        key = (id(self._current_view), func.start)
+        with self._lock:
+            self._apply_view_changes()
+            decompiled = self._decompile_cache.get(key)
+            if decompiled is not None:
+                self._decompile_cache.move_to_end(key)
+                return decompiled
+            generation = self._decompile_generation
+
         try:
             # Try high-level IL first for best readability
             if hasattr(func, "hlil"):
-                return str(func.hlil)
+                decompiled = str(func.hlil)
             # Fall back to medium-level IL if available
             elif hasattr(func, "mlil"):
-                return str(func.mlil)
+                decompiled = str(func.mlil)
             # Use basic function representation as last resort
             else:
-                return str(func)
+                decompiled = str(func)
         except Exception as e:
             bn.log_error(f"Error decompiling function: {str(e)}")
             return None
 
+        # Decompilation runs unlocked; skip storing text rendered before a rename,
+        # comment change or analysis update that happened meanwhile
+        with self._lock:
+            self._apply_view_changes()
+            if self._decompile_generation == generation:
+                self._decompile_cache[key] = decompiled
+                if len(self._decompile_cache) > DECOMPILE_CACHE_SIZE:
+                    self._decompile_cache.popitem(last=False)
+        return decompiled
+
+    @_synchronized
     def rename_data(self, address: int, new_name: str) -> bool:
         """Rename data at a specific address"""
         if not self._current_view:
@@ -379,9 +707,22 @@ class BinaryOperations:
 
         try:
             if self._current_view.is_valid_offset(address):
+                # Repeated renames to the same name are common; skip the redefinition
+                # only when it already exists as a user symbol, since an identical
+                # auto symbol still has to be turned into a user one
+                existing = self._current_view.get_symbol_at(address)
+                if (
+                    existing
+                    and existing.name == new_name
+                    and existing.type == bn.SymbolType.DataSymbol
+                    and not existing.auto
+                ):
+                    return True
+
                 self._current_view.define_user_symbol(
                     bn.Symbol(bn.SymbolType.DataSymbol, address, new_name)
                 )
+                self._invalidate_caches()
                 return True
         except Exception as e:
             bn.log_error(f"Failed to rename data: {e}")
@@ -394,46 +735,59 @@ class BinaryOperations:
         if not self._current_view:
             raise RuntimeError("No binary loaded")
 
-        data_items = []
-        for var in self._current_view.data_vars:
-            data_type = None
-            value = None
+        # Resolve the accessors available in this API version once
+        bv = self._current_view
+        get_type = getattr(bv, "get_type_at", None) or getattr(
+            bv, "get_data_var_at", None
+        )
+        get_symbol_at = bv.get_symbol_at
+        read_int = bv.read_int
+        has_raw_name = hasattr(bn.Symbol, "raw_name")
+
+        # data_vars maps addresses to DataVariable objects that already carry
+        # their type; older APIs only yield addresses
+        data_vars = bv.data_vars
+        if hasattr(data_vars, "items"):
+            entries = data_vars.items()
+        else:
+            entries = ((var, None) for var in data_vars)
 
-            try:
-                # Try to get data type safely
-                if hasattr(self._current_view, "get_type_at"):
-                    data_type = self._current_view.get_type_at(var)
-                elif hasattr(self._current_view, "get_data_var_at"):
-                    data_type = self._current_view.get_data_var_at(var)
-
-                # Try to read value if type is available and small enough
-                if data_type and hasattr(data_type, "width") and data_type.width <= 8:
-                    try:
-                        value = str(self._current_view.read_int(var, data_type.width))
-                    except (ValueError, RuntimeError):
-                        value = "(unreadable)"
-                else:
-                    value = "(complex data)"
-            except (AttributeError, TypeError, ValueError, RuntimeError):
-                value = "(unknown)"
+        data_items = []
+        for var, data_var in itertools.islice(entries, offset, offset + limit):
+            if data_var is not None:
+                data_type = data_var.type
+            elif get_type:
+                data_type = get_type(var)
+            else:
                 data_type = None
 
+            # Read the value if the type is small enough; only the read can fail
+            if data_type and hasattr(data_type, "width") and data_type.width <= 8:
+                try:
+                    value = str(read_int(var, data_type.width))
+                except (ValueError, RuntimeError, TypeError):
+                    value = "(unreadable)"
+            else:
+                value = "(complex data)"
+
             # Get symbol information
-            sym = self._current_view.get_symbol_at(var)
+            if data_var is not None:
+                sym = data_var.symbol
+            else:
+                sym = get_symbol_at(var)
             data_items.append(
                 {
-                    "address": hex(var),
+                    "address": f"{var:#x}",
                     "name": sym.name if sym else "(unnamed)",
-                    "raw_name": sym.raw_name
-                    if sym and hasattr(sym, "raw_name")
-                    else None,
+                    "raw_name": sym.raw_name if sym and has_raw_name else None,
                     "value": value,
                     "type": str(data_type) if data_type else None,
                 }
             )
 
-        return data_items[offset : offset + limit]
+        return data_items
 
+    @_synchronized
     def set_comment(self, address: int, comment: str) -> bool:
         """Set a comment at a specific address.
 
@@ -449,16 +803,21 @@ class BinaryOperations:
 
         try:
             if not self._current_view.is_valid_offset(address):
-                bn.log_error(f"Invalid address for comment: {hex(address)}")
+                bn.log_error(f"Invalid address for comment: {address:#x}")
                 return False
 
+            if self._current_view.get_comment_at(address) == comment:
+                return True
+
             self._current_view.set_comment_at(address, comment)
-            bn.log_info(f"Set comment at {hex(address)}: {comment}")
+            self._invalidate_decompile_cache()
+            bn.log_info(f"Set comment at {address:#x}: {comment}")
             return True
         except Exception as e:
             bn.log_error(f"Failed to set comment: {e}")
             return False
 
+    @_synchronized
     def set_function_comment(self, identifier: Union[str, int], comment: str) -> bool:
         """Set a comment for a function.
 
@@ -478,8 +837,12 @@ class BinaryOperations:
                 bn.log_error(f"Function not found: {identifier}")
                 return False
 
+            if self._current_view.get_comment_at(func.start) == comment:
+                return True
+
             self._current_view.set_comment_at(func.start, comment)
-            bn.log_info(f"Set comment for function {func.name} at {hex(func.start)}: {comment}")
+            self._invalidate_decompile_cache()
+            bn.log_info(f"Set comment for function {func.name} at {func.start:#x}: {comment}")
             return True
         except Exception as e:
             bn.log_error(f"Failed to set function comment: {e}")
@@ -499,7 +862,7 @@ class BinaryOperations:
 
         try:
             if not self._current_view.is_valid_offset(address):
-                bn.log_error(f"Invalid address for comment: {hex(address)}")
+                bn.log_error(f"Invalid address for comment: {address:#x}")
                 return None
 
             comment = self._current_view.get_comment_at(address)
@@ -532,6 +895,7 @@ class BinaryOperations:
             bn.log_error(f"Failed to get function comment: {e}")
             return None
 
+    @_synchronized
     def delete_comment(self, address: int) -> bool:
         """Delete a comment at a specific address"""
         if not self._current_view:
@@ -539,12 +903,17 @@ class BinaryOperations:
 
         try:
             if self._current_view.is_valid_offset(address):
+                if not self._current_view.get_comment_at(address):
+                    return True
+
                 self._current_view.set_comment_at(address, None)
+                self._invalidate_decompile_cache()
                 return True
         except Exception as e:
             bn.log_error(f"Failed to delete comment: {e}")
         return False
 
+    @_synchronized
     def delete_function_comment(self, identifier: Union[str, int]) -> bool:
         """Delete a comment for a function"""
         if not self._current_view:
@@ -554,8 +923,12 @@ class BinaryOperations:
             func = self.get_function_by_name_or_address(identifier)
             if not func:
                 return False
-                
+
+            if not func.comment:
+                return True
+
             func.comment = None
+            self._invalidate_decompile_cache()
             return True
         except Exception as e:
             bn.log_error(f"Failed to delete function comment: {e}")
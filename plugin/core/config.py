@@ -2,20 +2,22 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerConfig:
     host: str = "localhost"
     port: int = 9009
     debug: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class BinaryNinjaConfig:
     api_version: Optional[str] = None
     log_level: str = "INFO"
 
 
 class Config:
+    __slots__ = ("server", "binary_ninja")
+
     def __init__(self):
         self.server = ServerConfig()
         self.binary_ninja = BinaryNinjaConfig()
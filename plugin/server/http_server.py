@@ -1,17 +1,79 @@
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import json
+import os
+import socket
 import urllib.parse
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Optional
 import binaryninja as bn
 import threading
 from ..core.binary_operations import BinaryOperations
 from ..core.config import Config
 from ..api.endpoints import BinaryNinjaEndpoints
-from ..utils.string_utils import parse_int_or_default
+from ..utils.string_utils import parse_address, parse_int_or_default
+
+# Bound once; these are called on every request
+_log_info = bn.log_info
+_log_error = bn.log_error
+
+# Requests doing Binary Ninja work at once, and how many more open connections
+# may wait for a turn; connections past that are answered with a 503
+SERVER_WORKERS = os.cpu_count() or 1
+SERVER_QUEUE_DEPTH = 128
+
+try:
+    import orjson
+
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+    # catching the stdlib exception
+    _json_loads = orjson.loads
+
+except ImportError:
+
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
+    _json_loads = json.loads
+
+# Serialized once: (payload, status code) for errors that never change
+_ERR_NO_BINARY = (_json_dumps({"error": "No binary loaded"}), 400)
+_ERR_NOT_FOUND = (_json_dumps({"error": "Not found"}), 404)
+_ERR_POST_ONLY = (_json_dumps({"error": "All endpoints now use POST method"}), 405)
+_ERR_INVALID_ADDRESS = (_json_dumps({"error": "Invalid address format"}), 400)
+_ERR_MISSING_PARAMS = (_json_dumps({"error": "Missing parameters"}), 400)
+_ERR_MISSING_FILEPATH = (_json_dumps({"error": "Missing filepath parameter"}), 400)
+_ERR_MISSING_FUNCTION_NAME = (
+    _json_dumps({"error": "Missing function name parameter. Use name or functionName"}),
+    400,
+)
+_ERR_BUSY = (_json_dumps({"error": "Server busy, try again later"}), 503)
+
+# Full response sent by the server itself, before any handler exists
+_BUSY_RESPONSE = (
+    b"HTTP/1.1 503 Service Unavailable\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: %d\r\n"
+    b"Connection: close\r\n"
+    b"\r\n%s" % (len(_ERR_BUSY[0]), _ERR_BUSY[0])
+)
+
+# Route table entry for unknown paths: still report a missing binary first
+_UNKNOWN_ROUTE = (None, True)
+
+# /status is polled constantly and its shape never changes
+_STATUS_TEMPLATE = b'{"loaded":%s,"filename":%s}'
 
 
 class MCPRequestHandler(BaseHTTPRequestHandler):
     binary_ops = None  # Will be set by the server
+    debug = False  # Log request bodies and parameters (set by the server)
+
+    # Keep connections alive between requests; every response is sent with either
+    # a Content-Length or chunked encoding. Idle connections close after timeout.
+    protocol_version = "HTTP/1.1"
+    timeout = 60
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -26,21 +88,84 @@ class MCPRequestHandler(BaseHTTPRequestHandler):
         return self._endpoints
 
     def log_message(self, format, *args):
-        bn.log_info(format % args)
-
-    def _set_headers(self, content_type="application/json", status_code=200):
+        # Per-request access lines are only useful while debugging
+        if self.debug:
+            _log_info(format % args)
+
+    def log_error(self, format, *args):
+        _log_error(format % args)
+
+    def _set_headers(
+        self,
+        content_type="application/json",
+        status_code=200,
+        content_length=None,
+        chunked=False,
+    ):
         self.send_response(status_code)
         self.send_header("Content-Type", content_type)
+        if content_length is not None:
+            self.send_header("Content-Length", str(content_length))
+        elif chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+        if self.close_connection:
+            self.send_header("Connection", "close")
         self.send_header("Access-Control-Allow-Origin", "*")
         self.end_headers()
 
     def _send_json_response(self, data: Dict[str, Any], status_code: int = 200):
-        self._set_headers(status_code=status_code)
-        self.wfile.write(json.dumps(data).encode("utf-8"))
+        # Serialize before sending headers so the body length is known up front;
+        # the bytes are written as-is without further copies
+        self._send_json_bytes(_json_dumps(data), status_code)
+
+    def _send_json_bytes(self, payload: bytes, status_code: int = 200):
+        """Send an already serialized JSON payload"""
+        self._set_headers(status_code=status_code, content_length=len(payload))
+        self.wfile.write(payload)
+
+    def _send_json_stream(
+        self, key: str, rows: Iterable[Any], flush_size: int = 65536
+    ):
+        """Stream {key: [rows...]} as rows are produced instead of building a list.
+
+        HTTP/1.1 clients get chunked transfer encoding, one chunk per flush. Older
+        clients can't decode chunks, so their body is delimited by closing the
+        connection instead.
+        """
+        chunked = self.request_version == "HTTP/1.1"
+        if not chunked:
+            self.close_connection = True
+        self._set_headers(chunked=chunked)
+        buffer = bytearray(b"{" + _json_dumps(key) + b":[")
+        try:
+            for index, row in enumerate(rows):
+                if index:
+                    buffer += b","
+                buffer += _json_dumps(row)
+                if len(buffer) >= flush_size:
+                    if chunked:
+                        self.wfile.write(b"%x\r\n%s\r\n" % (len(buffer), buffer))
+                    else:
+                        self.wfile.write(buffer)
+                    buffer.clear()
+        except Exception as e:
+            # Headers are already sent, so all we can do is cut the body short;
+            # without the terminating chunk or JSON close the client sees it as
+            # incomplete
+            _log_error(f"Error streaming {key}: {e}")
+            self.close_connection = True
+            return
+        buffer += b"]}"
+        if chunked:
+            self.wfile.write(b"%x\r\n%s\r\n0\r\n\r\n" % (len(buffer), buffer))
+        else:
+            self.wfile.write(buffer)
 
     def _parse_query_params(self) -> Dict[str, str]:
-        parsed_path = urllib.parse.urlparse(self.path)
-        return dict(urllib.parse.parse_qsl(parsed_path.query))
+        query = urllib.parse.urlsplit(self.path).query
+        if not query:
+            return {}
+        return dict(urllib.parse.parse_qsl(query))
 
     def _parse_post_params(self) -> Dict[str, Any]:
         """Parse POST request parameters from various formats.
@@ -58,136 +183,170 @@ class MCPRequestHandler(BaseHTTPRequestHandler):
             return {}
 
         content_type = self.headers.get("Content-Type", "")
-        post_data = self.rfile.read(content_length).decode("utf-8")
+        ct = content_type.lower()
+        raw_data = self.rfile.read(content_length)
 
-        bn.log_info(f"Received POST data: {post_data}")
-        bn.log_info(f"Content-Type: {content_type}")
+        if self.debug:
+            _log_info(f"Received POST data: {raw_data.decode('utf-8', 'replace')}")
+            _log_info(f"Content-Type: {content_type}")
 
         # Handle JSON data
-        if "application/json" in content_type.lower():
+        if "application/json" in ct:
             try:
-                return json.loads(post_data)
+                parsed = _json_loads(raw_data)
             except json.JSONDecodeError as e:
-                bn.log_error(f"Failed to parse JSON: {e}")
+                _log_error(f"Failed to parse JSON: {e}")
                 return {"error": "Invalid JSON format"}
+            # Handlers look parameters up by key, so only objects are usable
+            if isinstance(parsed, dict):
+                return parsed
+            return {"error": "JSON body must be an object"}
 
         # Handle form data
-        if "application/x-www-form-urlencoded" in content_type.lower():
+        if "application/x-www-form-urlencoded" in ct:
+            post_data = raw_data.decode("utf-8")
             try:
                 return dict(urllib.parse.parse_qsl(post_data))
             except Exception as e:
-                bn.log_error(f"Failed to parse form data: {e}")
+                _log_error(f"Failed to parse form data: {e}")
                 return {"error": "Invalid form data format"}
 
         # Handle raw text
-        if "text/plain" in content_type.lower() or not content_type:
-            return {"name": post_data.strip()}
+        if "text/plain" in ct or not content_type:
+            return {"name": raw_data.decode("utf-8").strip()}
 
         # Try all formats as fallback
         try:
-            return json.loads(post_data)
+            parsed = _json_loads(raw_data)
+            if isinstance(parsed, dict):
+                return parsed
         except json.JSONDecodeError:
-            try:
-                parsed = dict(urllib.parse.parse_qsl(post_data))
-                if parsed:
-                    return parsed
-            except (ValueError, TypeError):
-                pass
+            pass
+
+        post_data = raw_data.decode("utf-8")
+        try:
+            parsed = dict(urllib.parse.parse_qsl(post_data))
+            if parsed:
+                return parsed
+        except (ValueError, TypeError):
+            pass
 
-            return {"name": post_data.strip()}
+        return {"name": post_data.strip()}
 
     def _check_binary_loaded(self):
         """Check if a binary is loaded and return appropriate error response if not"""
         if not self.binary_ops or not self.binary_ops.current_view:
-            self._send_json_response({"error": "No binary loaded"}, 400)
+            # The request body is left unread, so the connection can't be reused
+            self.close_connection = True
+            self._send_json_bytes(*_ERR_NO_BINARY)
             return False
         return True
 
     def do_GET(self):
+        # Any request body is ignored, so don't try to read another request after it
+        self.close_connection = True
+        self._send_json_bytes(*_ERR_POST_ONLY)
+
+    def _read_params(self) -> Optional[Dict[str, Any]]:
+        """Parse the request body, sending a 400 response and returning None if the
+        Content-Length or encoding is invalid"""
         try:
-            self._send_json_response({"error": "All endpoints now use POST method"}, 405)
-        except Exception as e:
-            bn.log_error(f"Error handling GET request: {e}")
-            self._send_json_response({"error": str(e)}, 500)
+            return self._parse_post_params()
+        except ValueError as e:
+            _log_error(f"Invalid request body: {e}")
+            self.close_connection = True
+            self._send_json_response({"error": f"Invalid request body: {e}"}, 400)
+            return None
+
+    def _send_handler_error(self, method: str, path: str, e: Exception):
+        _log_error(f"Error handling {method} {path}: {e}")
+        # The response may have been partially written, so don't reuse the connection
+        self.close_connection = True
+        self._send_json_response({"error": str(e)}, 500)
 
     def do_DELETE(self):
-        try:
-            if not self._check_binary_loaded():
-                return
+        path = urllib.parse.urlsplit(self.path).path
+        handler, needs_binary = self._DELETE_ROUTES.get(path, _UNKNOWN_ROUTE)
+        if needs_binary and not self._check_binary_loaded():
+            return
 
-            params = self._parse_post_params()
-            path = urllib.parse.urlparse(self.path).path
-
-            if path == "/comment":
-                address = params.get("address")
-                if not address:
-                    self._send_json_response(
-                        {
-                            "error": "Missing address parameter",
-                            "help": "Required parameter: address",
-                            "received": params,
-                        },
-                        400,
-                    )
-                    return
+        params = self._read_params()
+        if params is None:
+            return
 
-                try:
-                    address_int = int(address, 16) if isinstance(address, str) else int(address)
-                    success = self.binary_ops.delete_comment(address_int)
-                    if success:
-                        self._send_json_response(
-                            {
-                                "success": True,
-                                "message": f"Successfully deleted comment at {hex(address_int)}",
-                            }
-                        )
-                    else:
-                        self._send_json_response(
-                            {
-                                "error": "Failed to delete comment",
-                                "message": "The comment could not be deleted at the specified address.",
-                            },
-                            500,
-                        )
-                except ValueError:
-                    self._send_json_response({"error": "Invalid address format"}, 400)
-
-            elif path == "/comment/function":
-                function_name = params.get("name") or params.get("functionName")
-                if not function_name:
-                    self._send_json_response(
-                        {
-                            "error": "Missing function name parameter",
-                            "help": "Required parameter: name (or functionName)",
-                            "received": params,
-                        },
-                        400,
-                    )
-                    return
-
-                success = self.binary_ops.delete_function_comment(function_name)
-                if success:
-                    self._send_json_response(
-                        {
-                            "success": True,
-                            "message": f"Successfully deleted comment for function {function_name}",
-                        }
-                    )
-                else:
-                    self._send_json_response(
-                        {
-                            "error": "Failed to delete function comment",
-                            "message": "The comment could not be deleted for the specified function.",
-                        },
-                        500,
-                    )
+        if handler is None:
+            self._send_json_bytes(*_ERR_NOT_FOUND)
+            return
+
+        try:
+            with self.server.request_slots:
+                handler(self, params)
+        except Exception as e:
+            self._send_handler_error("DELETE", path, e)
+
+    def _delete_comment(self, params: Dict[str, Any]):
+        address = params.get("address")
+        if not address:
+            self._send_json_response(
+                {
+                    "error": "Missing address parameter",
+                    "help": "Required parameter: address",
+                    "received": params,
+                },
+                400,
+            )
+            return
 
+        try:
+            address_int = int(address, 16) if isinstance(address, str) else int(address)
+            success = self.binary_ops.delete_comment(address_int)
+            if success:
+                self._send_json_response(
+                    {
+                        "success": True,
+                        "message": f"Successfully deleted comment at {hex(address_int)}",
+                    }
+                )
             else:
-                self._send_json_response({"error": "Not found"}, 404)
+                self._send_json_response(
+                    {
+                        "error": "Failed to delete comment",
+                        "message": "The comment could not be deleted at the specified address.",
+                    },
+                    500,
+                )
+        except ValueError:
+            self._send_json_bytes(*_ERR_INVALID_ADDRESS)
 
-        except Exception as e:
-            bn.log_error(f"Error handling DELETE request: {e}")
-            self._send_json_response({"error": str(e)}, 500)
+    def _delete_function_comment(self, params: Dict[str, Any]):
+        function_name = params.get("name") or params.get("functionName")
+        if not function_name:
+            self._send_json_response(
+                {
+                    "error": "Missing function name parameter",
+                    "help": "Required parameter: name (or functionName)",
+                    "received": params,
+                },
+                400,
+            )
+            return
+
+        success = self.binary_ops.delete_function_comment(function_name)
+        if success:
+            self._send_json_response(
+                {
+                    "success": True,
+                    "message": f"Successfully deleted comment for function {function_name}",
+                }
+            )
+        else:
+            self._send_json_response(
+                {
+                    "error": "Failed to delete function comment",
+                    "message": "The comment could not be deleted for the specified function.",
+                },
+                500,
+            )
 
     def _handle_decompile(self, function_name: str):
         """Handle function decompilation requests.
@@ -202,20 +361,19 @@ class MCPRequestHandler(BaseHTTPRequestHandler):
         try:
             func_info = self.binary_ops.get_function_info(function_name)
             if not func_info:
-                bn.log_error(f"Function not found: {function_name}")
+                _log_error(f"Function not found: {function_name}")
                 self._send_json_response(
                     {
                         "error": "Function not found",
                         "requested_name": function_name,
-                        "available_functions": self.binary_ops.get_function_names(
-                            0, 10
-                        ),
+                        "available_functions": self.binary_ops.get_function_hints(),
                     },
                     404,
                 )
                 return
 
-            bn.log_info(f"Found function for decompilation: {func_info}")
+            if self.debug:
+                _log_info(f"Found function for decompilation: {func_info}")
             decompiled = self.binary_ops.decompile_function(function_name)
 
             if decompiled is None:
@@ -232,7 +390,7 @@ class MCPRequestHandler(BaseHTTPRequestHandler):
                     {"decompiled": decompiled, "function": func_info}
                 )
         except Exception as e:
-            bn.log_error(f"Error during decompilation: {e}")
+            _log_error(f"Error during decompilation: {e}")
             self._send_json_response(
                 {
                     "error": f"Decompilation error: {str(e)}",
@@ -242,250 +400,340 @@ class MCPRequestHandler(BaseHTTPRequestHandler):
             )
 
     def do_POST(self):
+        path = urllib.parse.urlsplit(self.path).path
+        handler, needs_binary = self._POST_ROUTES.get(path, _UNKNOWN_ROUTE)
+        if needs_binary and not self._check_binary_loaded():
+            return
+
+        params = self._read_params()
+        if params is None:
+            return
+        # Negative values would be rejected by islice and heapq further down
+        offset = max(parse_int_or_default(params.get("offset"), 0), 0)
+        limit = max(parse_int_or_default(params.get("limit"), 100), 0)
+
+        if self.debug:
+            _log_info(f"POST {path} with params: {params}")
+
+        if handler is None:
+            self._send_json_bytes(*_ERR_NOT_FOUND)
+            return
+
         try:
-            if not self._check_binary_loaded():
-                return
+            with self.server.request_slots:
+                handler(self, params, offset, limit)
+        except Exception as e:
+            self._send_handler_error("POST", path, e)
+
+    def _post_status(self, params: Dict[str, Any], offset: int, limit: int):
+        view = self.binary_ops.current_view if self.binary_ops else None
+        self._send_json_bytes(
+            _STATUS_TEMPLATE
+            % (
+                b"false" if view is None else b"true",
+                _json_dumps(None if view is None else view.file.filename),
+            )
+        )
 
-            params = self._parse_post_params()
-            path = urllib.parse.urlparse(self.path).path
-            offset = parse_int_or_default(params.get("offset"), 0)
-            limit = parse_int_or_default(params.get("limit"), 100)
+    def _post_functions(self, params: Dict[str, Any], offset: int, limit: int):
+        functions = self.binary_ops.get_function_names(offset, limit)
+        if self.debug:
+            _log_info(f"Found {len(functions)} functions")
+        self._send_json_bytes(b'{"functions":' + _json_dumps(functions) + b"}")
 
-            bn.log_info(f"POST {path} with params: {params}")
+    def _post_classes(self, params: Dict[str, Any], offset: int, limit: int):
+        classes = self.binary_ops.get_class_names(offset, limit)
+        self._send_json_response({"classes": classes})
 
-            if path == "/status":
-                status = {
-                    "loaded": self.binary_ops
-                    and self.binary_ops.current_view is not None,
-                    "filename": self.binary_ops.current_view.file.filename
-                    if self.binary_ops and self.binary_ops.current_view
-                    else None,
-                }
-                self._send_json_response(status)
+    def _post_segments(self, params: Dict[str, Any], offset: int, limit: int):
+        segments = self.binary_ops.get_segments(offset, limit)
+        self._send_json_response({"segments": segments})
 
-            elif path == "/functions" or path == "/methods":
-                functions = self.binary_ops.get_function_names(offset, limit)
-                bn.log_info(f"Found {len(functions)} functions")
-                self._send_json_response({"functions": functions})
+    def _post_imports(self, params: Dict[str, Any], offset: int, limit: int):
+        imports = self.endpoints.get_imports(offset, limit)
+        self._send_json_stream("imports", imports)
 
-            elif path == "/classes":
-                classes = self.binary_ops.get_class_names(offset, limit)
-                self._send_json_response({"classes": classes})
+    def _post_exports(self, params: Dict[str, Any], offset: int, limit: int):
+        exports = self.endpoints.get_exports(offset, limit)
+        self._send_json_stream("exports", exports)
 
-            elif path == "/segments":
-                segments = self.binary_ops.get_segments(offset, limit)
-                self._send_json_response({"segments": segments})
+    def _post_namespaces(self, params: Dict[str, Any], offset: int, limit: int):
+        namespaces = self.endpoints.get_namespaces(offset, limit)
+        self._send_json_response({"namespaces": namespaces})
 
-            elif path == "/imports":
-                imports = self.endpoints.get_imports(offset, limit)
-                self._send_json_response({"imports": imports})
+    def _post_data(self, params: Dict[str, Any], offset: int, limit: int):
+        try:
+            data_items = self.binary_ops.get_defined_data(offset, limit)
+            self._send_json_response({"data": data_items})
+        except Exception as e:
+            _log_error(f"Error getting data items: {e}")
+            self._send_json_response({"error": str(e)}, 500)
 
-            elif path == "/exports":
-                exports = self.endpoints.get_exports(offset, limit)
-                self._send_json_response({"exports": exports})
+    def _post_load(self, params: Dict[str, Any], offset: int, limit: int):
+        filepath = params.get("filepath")
+        if not filepath:
+            self._send_json_bytes(*_ERR_MISSING_FILEPATH)
+            return
 
-            elif path == "/namespaces":
-                namespaces = self.endpoints.get_namespaces(offset, limit)
-                self._send_json_response({"namespaces": namespaces})
+        try:
+            self.binary_ops.load_binary(filepath)
+            self._send_json_response(
+                {"success": True, "message": f"Binary loaded: {filepath}"}
+            )
+        except Exception as e:
+            self._send_json_response({"error": str(e)}, 500)
 
-            elif path == "/data":
-                try:
-                    data_items = self.binary_ops.get_defined_data(offset, limit)
-                    self._send_json_response({"data": data_items})
-                except Exception as e:
-                    bn.log_error(f"Error getting data items: {e}")
-                    self._send_json_response({"error": str(e)}, 500)
-
-            elif path == "/load":
-                filepath = params.get("filepath")
-                if not filepath:
-                    self._send_json_response(
-                        {"error": "Missing filepath parameter"}, 400
-                    )
-                    return
+    def _post_search_functions(self, params: Dict[str, Any], offset: int, limit: int):
+        search_term = params.get("query", "")
+        matches = self.endpoints.search_functions(search_term, offset, limit)
+        self._send_json_response({"matches": matches})
 
-                try:
-                    self.binary_ops.load_binary(filepath)
-                    self._send_json_response(
-                        {"success": True, "message": f"Binary loaded: {filepath}"}
-                    )
-                except Exception as e:
-                    self._send_json_response({"error": str(e)}, 500)
-
-            elif path == "/searchFunctions":
-                search_term = params.get("query", "")
-                matches = self.endpoints.search_functions(search_term, offset, limit)
-                self._send_json_response({"matches": matches})
-
-            elif path == "/decompile":
-                function_name = params.get("name") or params.get("functionName")
-                if not function_name:
-                    self._send_json_response(
-                        {
-                            "error": "Missing function name parameter. Use name or functionName"
-                        },
-                        400,
-                    )
-                    return
-
-                self._handle_decompile(function_name)
-
-            elif path == "/comment":
-                address = params.get("address")
-                comment = params.get("comment")
-                if not address or comment is None:
-                    self._send_json_response(
-                        {
-                            "error": "Missing parameters",
-                            "help": "Required parameters: address and comment",
-                            "received": params,
-                        },
-                        400,
-                    )
-                    return
+    def _post_decompile(self, params: Dict[str, Any], offset: int, limit: int):
+        function_name = params.get("name") or params.get("functionName")
+        if not function_name:
+            self._send_json_bytes(*_ERR_MISSING_FUNCTION_NAME)
+            return
 
-                try:
-                    address_int = int(address, 16) if isinstance(address, str) else int(address)
-                    success = self.binary_ops.set_comment(address_int, comment)
-                    if success:
-                        self._send_json_response(
-                            {
-                                "success": True,
-                                "message": f"Successfully set comment at {hex(address_int)}",
-                                "comment": comment,
-                            }
-                        )
-                    else:
-                        self._send_json_response(
-                            {
-                                "error": "Failed to set comment",
-                                "message": "The comment could not be set at the specified address.",
-                            },
-                            500,
-                        )
-                except ValueError:
-                    self._send_json_response({"error": "Invalid address format"}, 400)
-
-            elif path == "/comment/function":
-                function_name = params.get("name") or params.get("functionName")
-                comment = params.get("comment")
-                if not function_name or comment is None:
-                    self._send_json_response(
-                        {
-                            "error": "Missing parameters",
-                            "help": "Required parameters: name (or functionName) and comment",
-                            "received": params,
-                        },
-                        400,
-                    )
-                    return
-
-                success = self.binary_ops.set_function_comment(function_name, comment)
-                if success:
-                    self._send_json_response(
-                        {
-                            "success": True,
-                            "message": f"Successfully set comment for function {function_name}",
-                            "comment": comment,
-                        }
-                    )
-                else:
-                    self._send_json_response(
-                        {
-                            "error": "Failed to set function comment",
-                            "message": "The comment could not be set for the specified function.",
-                        },
-                        500,
-                    )
-
-            elif path == "/rename/function" or path == "/renameFunction":
-                old_name = params.get("oldName") or params.get("old_name")
-                new_name = params.get("newName") or params.get("new_name")
-
-                bn.log_info(
-                    f"Rename request - old_name: {old_name}, new_name: {new_name}, params: {params}"
+        self._handle_decompile(function_name)
+
+    def _post_comment(self, params: Dict[str, Any], offset: int, limit: int):
+        address = params.get("address")
+        comment = params.get("comment")
+        if not address or comment is None:
+            self._send_json_response(
+                {
+                    "error": "Missing parameters",
+                    "help": "Required parameters: address and comment",
+                    "received": params,
+                },
+                400,
+            )
+            return
+
+        try:
+            address_int = int(address, 16) if isinstance(address, str) else int(address)
+            success = self.binary_ops.set_comment(address_int, comment)
+            if success:
+                self._send_json_response(
+                    {
+                        "success": True,
+                        "message": f"Successfully set comment at {hex(address_int)}",
+                        "comment": comment,
+                    }
                 )
+            else:
+                self._send_json_response(
+                    {
+                        "error": "Failed to set comment",
+                        "message": "The comment could not be set at the specified address.",
+                    },
+                    500,
+                )
+        except ValueError:
+            self._send_json_bytes(*_ERR_INVALID_ADDRESS)
 
-                if not old_name or not new_name:
-                    self._send_json_response(
-                        {
-                            "error": "Missing parameters",
-                            "help": "Required parameters: oldName (or old_name) and newName (or new_name)",
-                            "received": params,
-                        },
-                        400,
-                    )
-                    return
-
-                # Handle address format (both 0x... and plain number)
-                if isinstance(old_name, str):
-                    if old_name.startswith("0x"):
-                        try:
-                            old_name = int(old_name, 16)
-                        except ValueError:
-                            pass
-                    elif old_name.isdigit():
-                        old_name = int(old_name)
-
-                bn.log_info(f"Attempting to rename function: {old_name} -> {new_name}")
-
-                # Get function info for validation
-                func_info = self.binary_ops.get_function_info(old_name)
-                if func_info:
-                    bn.log_info(f"Found function: {func_info}")
-                    success = self.binary_ops.rename_function(old_name, new_name)
-                    if success:
-                        self._send_json_response(
-                            {
-                                "success": True,
-                                "message": f"Successfully renamed function from {old_name} to {new_name}",
-                                "function": func_info,
-                            }
-                        )
-                    else:
-                        self._send_json_response(
-                            {
-                                "error": "Failed to rename function",
-                                "message": "The function was found but could not be renamed. This might be due to permissions or binary restrictions.",
-                                "function": func_info,
-                            },
-                            500,
-                        )
-                else:
-                    available_funcs = self.binary_ops.get_function_names(0, 10)
-                    bn.log_error(f"Function not found: {old_name}")
-                    self._send_json_response(
-                        {
-                            "error": "Function not found",
-                            "requested": old_name,
-                            "help": "Make sure the function exists. You can use either the function name or its address.",
-                            "available_functions": available_funcs,
-                        },
-                        404,
-                    )
-
-            elif path == "/rename/data" or path == "/renameData":
-                address = params.get("address")
-                new_name = params.get("newName") or params.get("new_name")
-                if not address or not new_name:
-                    self._send_json_response({"error": "Missing parameters"}, 400)
-                    return
+    def _post_function_comment(self, params: Dict[str, Any], offset: int, limit: int):
+        function_name = params.get("name") or params.get("functionName")
+        comment = params.get("comment")
+        if not function_name or comment is None:
+            self._send_json_response(
+                {
+                    "error": "Missing parameters",
+                    "help": "Required parameters: name (or functionName) and comment",
+                    "received": params,
+                },
+                400,
+            )
+            return
 
-                try:
-                    address_int = (
-                        int(address, 16) if isinstance(address, str) else int(address)
-                    )
-                    success = self.binary_ops.rename_data(address_int, new_name)
-                    self._send_json_response({"success": success})
-                except ValueError:
-                    self._send_json_response({"error": "Invalid address format"}, 400)
+        success = self.binary_ops.set_function_comment(function_name, comment)
+        if success:
+            self._send_json_response(
+                {
+                    "success": True,
+                    "message": f"Successfully set comment for function {function_name}",
+                    "comment": comment,
+                }
+            )
+        else:
+            self._send_json_response(
+                {
+                    "error": "Failed to set function comment",
+                    "message": "The comment could not be set for the specified function.",
+                },
+                500,
+            )
+
+    def _post_rename_function(self, params: Dict[str, Any], offset: int, limit: int):
+        old_name = params.get("oldName") or params.get("old_name")
+        new_name = params.get("newName") or params.get("new_name")
 
+        if self.debug:
+            _log_info(
+                f"Rename request - old_name: {old_name}, new_name: {new_name}, params: {params}"
+            )
+
+        if not old_name or not new_name:
+            self._send_json_response(
+                {
+                    "error": "Missing parameters",
+                    "help": "Required parameters: oldName (or old_name) and newName (or new_name)",
+                    "received": params,
+                },
+                400,
+            )
+            return
+
+        # Handle address format (both 0x... and plain number)
+        address = parse_address(old_name)
+        if address is not None:
+            old_name = address
+
+        if self.debug:
+            _log_info(f"Attempting to rename function: {old_name} -> {new_name}")
+
+        # Get function info for validation
+        func_info = self.binary_ops.get_function_info(old_name)
+        if func_info:
+            if self.debug:
+                _log_info(f"Found function: {func_info}")
+            success = self.binary_ops.rename_function(old_name, new_name)
+            if success:
+                self._send_json_response(
+                    {
+                        "success": True,
+                        "message": f"Successfully renamed function from {old_name} to {new_name}",
+                        "function": func_info,
+                    }
+                )
             else:
-                self._send_json_response({"error": "Not found"}, 404)
+                self._send_json_response(
+                    {
+                        "error": "Failed to rename function",
+                        "message": "The function was found but could not be renamed. This might be due to permissions or binary restrictions.",
+                        "function": func_info,
+                    },
+                    500,
+                )
+        else:
+            available_funcs = self.binary_ops.get_function_hints()
+            _log_error(f"Function not found: {old_name}")
+            self._send_json_response(
+                {
+                    "error": "Function not found",
+                    "requested": old_name,
+                    "help": "Make sure the function exists. You can use either the function name or its address.",
+                    "available_functions": available_funcs,
+                },
+                404,
+            )
 
-        except Exception as e:
-            bn.log_error(f"Error handling POST request: {e}")
-            self._send_json_response({"error": str(e)}, 500)
+    def _post_rename_data(self, params: Dict[str, Any], offset: int, limit: int):
+        address = params.get("address")
+        new_name = params.get("newName") or params.get("new_name")
+        if not address or not new_name:
+            self._send_json_bytes(*_ERR_MISSING_PARAMS)
+            return
+
+        try:
+            address_int = int(address, 16) if isinstance(address, str) else int(address)
+            success = self.binary_ops.rename_data(address_int, new_name)
+            self._send_json_response({"success": success})
+        except ValueError:
+            self._send_json_bytes(*_ERR_INVALID_ADDRESS)
+
+    # Path -> (handler, needs a loaded binary), built once when the class is defined
+    _POST_ROUTES = {
+        "/status": (_post_status, False),
+        "/functions": (_post_functions, True),
+        "/methods": (_post_functions, True),
+        "/classes": (_post_classes, True),
+        "/segments": (_post_segments, True),
+        "/imports": (_post_imports, True),
+        "/exports": (_post_exports, True),
+        "/namespaces": (_post_namespaces, True),
+        "/data": (_post_data, True),
+        "/load": (_post_load, False),
+        "/searchFunctions": (_post_search_functions, True),
+        "/decompile": (_post_decompile, True),
+        "/comment": (_post_comment, True),
+        "/comment/function": (_post_function_comment, True),
+        "/rename/function": (_post_rename_function, True),
+        "/renameFunction": (_post_rename_function, True),
+        "/rename/data": (_post_rename_data, True),
+        "/renameData": (_post_rename_data, True),
+    }
+
+    _DELETE_ROUTES = {
+        "/comment": (_delete_comment, True),
+        "/comment/function": (_delete_function_comment, True),
+    }
+
+
+class BoundedThreadingHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer with a bounded number of workers and waiting connections.
+
+    Each connection gets a daemon thread, but only max_workers requests run
+    handlers at a time; the rest wait on request_slots. Idle keep-alive
+    connections don't hold a worker. Once queue_depth more connections are open,
+    new ones get a 503 instead of another thread.
+    """
+
+    def __init__(
+        self,
+        server_address,
+        handler_class,
+        max_workers: int = SERVER_WORKERS,
+        queue_depth: int = SERVER_QUEUE_DEPTH,
+    ):
+        super().__init__(server_address, handler_class)
+        self.request_slots = threading.BoundedSemaphore(max_workers)
+        self._connection_slots = threading.BoundedSemaphore(max_workers + queue_depth)
+        self._active_requests = set()
+        self._active_lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        if not self._connection_slots.acquire(blocking=False):
+            _log_error(f"Too many open connections, rejecting {client_address[0]}")
+            self._reject_busy(request)
+            return
+        try:
+            super().process_request(request, client_address)
+        except Exception:
+            # The handler thread never started, so it won't release the slot
+            self._connection_slots.release()
+            raise
+
+    def _reject_busy(self, request):
+        try:
+            request.sendall(_BUSY_RESPONSE)
+            # Drain what the client already sent so closing doesn't reset the
+            # connection before the response is read
+            request.setblocking(False)
+            request.recv(65536)
+        except OSError:
+            pass
+        self.shutdown_request(request)
+
+    def process_request_thread(self, request, client_address):
+        with self._active_lock:
+            self._active_requests.add(request)
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            with self._active_lock:
+                self._active_requests.discard(request)
+            self._connection_slots.release()
+
+    def server_close(self):
+        super().server_close()
+        # Disconnect idle keep-alive clients instead of leaving them to time out
+        with self._active_lock:
+            for request in self._active_requests:
+                try:
+                    request.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
 
 
 class MCPServer:
@@ -503,23 +751,31 @@ class MCPServer:
         self.server = None
         self.thread = None
         self.binary_ops = BinaryOperations(config.binary_ninja)
+        self.endpoints = BinaryNinjaEndpoints(self.binary_ops)
 
     def start(self):
         """Start the HTTP server in a background thread."""
         server_address = (self.config.server.host, self.config.server.port)
 
-        # Create handler with access to binary operations
+        # Create handler with access to binary operations. Endpoints are shared
+        # across requests so their per-view caches survive between calls.
         handler_class = type(
             "MCPRequestHandlerWithOps",
             (MCPRequestHandler,),
-            {"binary_ops": self.binary_ops},
+            {
+                "binary_ops": self.binary_ops,
+                "_endpoints": self.endpoints,
+                "debug": self.config.server.debug,
+            },
         )
 
-        self.server = HTTPServer(server_address, handler_class)
+        # Serve each connection on its own thread so a slow decompile does not
+        # block other clients
+        self.server = BoundedThreadingHTTPServer(server_address, handler_class)
         self.thread = threading.Thread(target=self.server.serve_forever)
         self.thread.daemon = True
         self.thread.start()
-        bn.log_info(
+        _log_info(
             f"Server started on {self.config.server.host}:{self.config.server.port}"
         )
 
@@ -530,4 +786,4 @@ class MCPServer:
             self.server.server_close()
             if self.thread:
                 self.thread.join()
-            bn.log_info("Server stopped")
+            _log_info("Server stopped")
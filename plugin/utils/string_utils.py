@@ -1,21 +1,51 @@
+import re
+from typing import Optional, Union
+
+_HEX_DIGITS = "0123456789abcdefABCDEF"
+
+# Escapes for every non-printable code point below 256; anything above is
+# left to _WIDE_CHAR
+_ESCAPE_TABLE = {i: f"\\x{i:02x}" for i in range(256) if not 32 <= i < 127}
+_WIDE_CHAR = re.compile(r"[^\x00-\x7f]")
+
+
 def escape_non_ascii(input_str: str) -> str:
     """Escape non-ASCII characters in a string"""
     if input_str is None:
         return ""
-    result = ""
-    for c in input_str:
-        if 32 <= ord(c) < 127:
-            result += c
-        else:
-            result += f"\\x{ord(c):02x}"
-    return result
+    result = input_str.translate(_ESCAPE_TABLE)
+    if result.isascii():
+        return result
+    return _WIDE_CHAR.sub(lambda m: f"\\x{ord(m.group()):02x}", result)
 
 
 def parse_int_or_default(val: str, default: int) -> int:
     """Parse an integer from a string or return a default value"""
     if val is None:
         return default
+    if isinstance(val, int):
+        return val
+    if isinstance(val, str):
+        # Validate first so bad input doesn't pay for a raised ValueError
+        digits = val.strip()
+        if digits[:1] in ("-", "+"):
+            digits = digits[1:]
+        return int(val) if digits.isdecimal() else default
     try:
         return int(val)
     except (ValueError, TypeError):
         return default
+
+
+def parse_address(val: Union[str, int, None]) -> Optional[int]:
+    """Parse an int, hex ("0x...") or decimal string address, or return None"""
+    if isinstance(val, int):
+        return val
+    if isinstance(val, str):
+        if val.startswith(("0x", "0X")):
+            digits = val[2:]
+            if digits and not digits.strip(_HEX_DIGITS):
+                return int(digits, 16)
+        elif val.isascii() and val.isdecimal():
+            return int(val)
+    return None